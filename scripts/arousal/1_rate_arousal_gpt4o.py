@@ -23,12 +23,17 @@ openai.api_key = api_key
 # ---- dataset & paths ----
 _ap = argparse.ArgumentParser(add_help=False)
 _ap.add_argument("--dataset", choices=["Filmfest", "Sherlock"])
+_ap.add_argument("--status-file", dest="status_file", default=os.getenv("STATUS_FILE"),
+                help="optional JSON file refreshed with live progress")
 _args, _ = _ap.parse_known_args()
 DATASET_NAME = _args.dataset or os.getenv("DATASET", "Filmfest")
 
 REPO = Path(__file__).resolve().parents[2] if "__file__" in globals() else Path.cwd()
 DS_ROOT = REPO / "data" / DATASET_NAME
 
+sys.path.insert(0, str(REPO / "scripts"))
+from progress_monitor import ProgressMonitor
+
 DAT_PATH = DS_ROOT / "1_annotations"
 if not DAT_PATH.exists():
     sys.exit(f"[ERROR] Not found: {DAT_PATH}")
@@ -68,20 +73,23 @@ if __name__ == "__main__":
     annotations = pd.read_csv(annotation_file)
 
     results = []
-    for idx, row in annotations.iterrows():
-        event_number = row.get('event_number', None)
-        annotation_text = row.get('annotation', '')
+    with ProgressMonitor(len(annotations), f"arousal {DATASET_NAME}", _args.status_file) as progress:
+        for idx, row in annotations.iterrows():
+            event_number = row.get('event_number', None)
+            annotation_text = row.get('annotation', '')
 
-        # Check: skip if event_number is missing or NaN
-        if pd.isna(event_number):
-            print(f"Skipping row {idx} due to missing event_number.")
-            continue
+            # Check: skip if event_number is missing or NaN
+            if pd.isna(event_number):
+                progress.log(f"Skipping row {idx} due to missing event_number.")
+                progress.advance()
+                continue
 
-        score = rate_event_arousal(annotation_text)
-        results.append({
-            'event_number': event_number,
-            'arousal_score': score
-        })
+            score = progress.call(rate_event_arousal, annotation_text)
+            results.append({
+                'event_number': event_number,
+                'arousal_score': score
+            })
+            progress.advance()
 
     results_df = pd.DataFrame(results)
     output_file = os.path.join(SAVE_PATH, f"{DATASET_NAME}_arousal_gpt4o.csv")
@@ -22,12 +22,17 @@ openai.api_key = api_key
 # ---- dataset & paths ----
 _ap = argparse.ArgumentParser(add_help=False)
 _ap.add_argument("--dataset", choices=["Filmfest", "Sherlock"])
+_ap.add_argument("--status-file", dest="status_file", default=os.getenv("STATUS_FILE"),
+                help="optional JSON file refreshed with live progress")
 _args, _ = _ap.parse_known_args()
 DATASET_NAME = _args.dataset or os.getenv("DATASET", "Filmfest")
 
 REPO = Path(__file__).resolve().parents[2] if "__file__" in globals() else Path.cwd()
 DS_ROOT = REPO / "data" / DATASET_NAME
 
+sys.path.insert(0, str(REPO / "scripts"))
+from progress_monitor import ProgressMonitor
+
 DAT_PATH = DS_ROOT / "1_annotations"
 if not DAT_PATH.exists():
     sys.exit(f"[ERROR] Not found: {DAT_PATH}")
@@ -120,23 +125,26 @@ if __name__ == "__main__":
     summaries = pd.read_csv(summary_file)
 
     central_tables_all = []
-    for idx, row in annotations.iterrows():
-        event_number = row['event_number']
-        annotation_text = row['annotation']
-
-        if 'movie_title' in annotations.columns and pd.notna(row.get('movie_title')):
-            movie_title = row['movie_title']
-            # filter summaries for that movie_title
-            match = summaries.loc[summaries["movie_title"] == movie_title, "summary"]
-            if not match.empty:
-                summary = match.iloc[0]
+    with ProgressMonitor(len(annotations), f"central {DATASET_NAME}", _args.status_file) as progress:
+        for idx, row in annotations.iterrows():
+            event_number = row['event_number']
+            annotation_text = row['annotation']
+
+            if 'movie_title' in annotations.columns and pd.notna(row.get('movie_title')):
+                movie_title = row['movie_title']
+                # filter summaries for that movie_title
+                match = summaries.loc[summaries["movie_title"] == movie_title, "summary"]
+                if not match.empty:
+                    summary = match.iloc[0]
+                else:
+                    progress.advance()
+                    continue
             else:
-                continue
-        else:
-            summary = summaries['summary'].iloc[0]
-        
-        central_table = parse_central_detail_table(generate_central_details(summary, annotation_text), event_number)
-        central_tables_all.append(central_table)
+                summary = summaries['summary'].iloc[0]
+
+            central_table = parse_central_detail_table(progress.call(generate_central_details, summary, annotation_text), event_number)
+            central_tables_all.append(central_table)
+            progress.advance()
 
     central_df = flatten_central_data(central_tables_all)
     central_df.to_csv(f"{SAVE_PATH}/{DATASET_NAME}_balanced_central_detail_table.csv", index=False)
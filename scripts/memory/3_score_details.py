@@ -25,6 +25,8 @@ _ap.add_argument("--dataset", choices=["Filmfest", "Sherlock"],
                 default=os.getenv("DATASET", "Filmfest"))
 _ap.add_argument("--mem-type", dest="mem_type", choices=["central", "peripheral"],
                 default=os.getenv("MEM_TYPE", "central"))
+_ap.add_argument("--status-file", dest="status_file", default=os.getenv("STATUS_FILE"),
+                help="optional JSON file refreshed with live progress")
 _args, _ = _ap.parse_known_args()
 
 DATASET_NAME = _args.dataset
@@ -33,6 +35,9 @@ MEM_TYPE = _args.mem_type
 REPO = Path(__file__).resolve().parents[2] if "__file__" in globals() else Path.cwd()
 DS_ROOT = REPO / "data" / DATASET_NAME
 
+sys.path.insert(0, str(REPO / "scripts"))
+from progress_monitor import ProgressMonitor
+
 DAT_PATH = DS_ROOT / "1_annotations"
 if not DAT_PATH.exists():
     sys.exit(f"[ERROR] Not found: {DAT_PATH}")
@@ -230,50 +235,58 @@ if __name__ == "__main__":
 
     id_col = 'central_id' if MEM_TYPE == 'central' else 'peripheral_id'
 
-    # iterate over participants （files）
-    all_results = []
+    # count participant-events up front so progress can report a total and an ETA
+    recalls = []
     for recall_path in recall_files:
         df, participant_id = read_recall_file(recall_path)
         transcript_by_event = parse_recall(df)
         event_ids = [ev[0] for ev in transcript_by_event]
-        number_events = len(set(event_ids))
-        print(f"{participant_id}: {number_events} events")
-
-        # iterate over events
-        results = []
-        for i in range(number_events):
-            event_number = transcript_by_event[i][0]
-            participant_recall = transcript_by_event[i][1]
-
-            detail_table = parse_table_by_event(detail_df, event_number)
-
-            # Skip events without recalls and record them as 0
-            if pd.isna(participant_recall):
-                if not detail_table.empty:
-                    for did in detail_table[id_col].astype(str).tolist():
-                        results.append({
-                            "participant_id": participant_id,
-                            "event_number": event_number,
-                            id_col: did,
-                            "score": 0
-                        })
-                continue
-            
-            if MEM_TYPE == 'central':
-                gpt_output = generate_graded_central_scores(participant_id, participant_recall, event_number, detail_table)
-                output = parse_central_score_table(gpt_output)
-            else:
-                gpt_output = generate_graded_peripheral_scores(participant_id, participant_recall, event_number, detail_table)
-                output = parse_peripheral_score_table(gpt_output)
-            for row in output:
-                row["participant_id"] = participant_id
-                row["event_number"] = event_number
-            results.extend(output)
-        
-        results_df = pd.DataFrame(results)
-        print(f"{participant_id} done")
-        all_results.append(results_df)
-    
+        recalls.append((participant_id, transcript_by_event, len(set(event_ids))))
+    total_events = sum(n for _, _, n in recalls)
+
+    # iterate over participants （files）
+    all_results = []
+    with ProgressMonitor(total_events, f"score {MEM_TYPE} {DATASET_NAME}", _args.status_file) as progress:
+        for participant_id, transcript_by_event, number_events in recalls:
+            progress.log(f"{participant_id}: {number_events} events")
+
+            # iterate over events
+            results = []
+            for i in range(number_events):
+                event_number = transcript_by_event[i][0]
+                participant_recall = transcript_by_event[i][1]
+
+                detail_table = parse_table_by_event(detail_df, event_number)
+
+                # Skip events without recalls and record them as 0
+                if pd.isna(participant_recall):
+                    if not detail_table.empty:
+                        for did in detail_table[id_col].astype(str).tolist():
+                            results.append({
+                                "participant_id": participant_id,
+                                "event_number": event_number,
+                                id_col: did,
+                                "score": 0
+                            })
+                    progress.advance()
+                    continue
+
+                if MEM_TYPE == 'central':
+                    gpt_output = progress.call(generate_graded_central_scores, participant_id, participant_recall, event_number, detail_table)
+                    output = parse_central_score_table(gpt_output)
+                else:
+                    gpt_output = progress.call(generate_graded_peripheral_scores, participant_id, participant_recall, event_number, detail_table)
+                    output = parse_peripheral_score_table(gpt_output)
+                for row in output:
+                    row["participant_id"] = participant_id
+                    row["event_number"] = event_number
+                results.extend(output)
+                progress.advance()
+
+            results_df = pd.DataFrame(results)
+            progress.log(f"{participant_id} done")
+            all_results.append(results_df)
+
     all_combined = pd.concat(all_results, ignore_index=True)
     all_combined = all_combined.sort_values(by=["participant_id", "event_number"])
     all_combined.to_csv(f"{SAVE_PATH}/graded_{MEM_TYPE}_scores_compiled.csv", index=False)
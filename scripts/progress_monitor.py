@@ -0,0 +1,244 @@
+# scripts/progress_monitor.py
+# Authors: Yolanda Pan (xpan02@uchicago.edu)
+# Last Edited: October 19, 2026
+# Description: Shared progress tracking for the LLM scripts: units done/total, request rate,
+#              in-flight calls, recent errors/retries and ETA, shown in the terminal and
+#              optionally written to a JSON status file that can be polled.
+
+import os, sys, json, time, logging, threading
+from collections import deque
+
+# The openai SDK retries 408/409/429/5xx and connection errors itself (honouring Retry-After),
+# and logs each retry at INFO as "Retrying request to <url> in <n> seconds".
+OPENAI_LOGGER = "openai"
+RETRY_LOG_PREFIX = "Retrying request"
+
+WINDOW_SEC = 60.0      # sliding window for request rate and recent errors/retries
+REFRESH_SEC = 1.0      # heartbeat period: live line (tty) and status file are refreshed at least this often
+LOG_EVERY_SEC = 30.0   # minimum time between progress lines when stderr is not a tty
+
+
+class _RetryLogHandler(logging.Handler):
+    """Counts the openai SDK's own retries from its log records, without taking them over."""
+
+    def __init__(self, monitor):
+        super().__init__(logging.INFO)
+        self.monitor = monitor
+
+    def emit(self, record):
+        if str(record.msg).startswith(RETRY_LOG_PREFIX):
+            self.monitor._record_retry()
+
+
+def _fmt_duration(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+class ProgressMonitor:
+    """Thread-safe progress tracker for a run of `total` units (events, participant-events, ...)."""
+
+    def __init__(self, total, label="", status_file=None):
+        self.total = int(total)
+        self.label = label
+        self.status_file = status_file
+
+        self.done = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.state = "running"
+
+        self._start = time.time()
+        self._request_times = deque()   # completion time of every LLM request
+        self._error_times = deque()
+        self._retry_times = deque()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._tty = sys.stderr.isatty()
+        self._last_render = 0.0
+        self._last_write = 0.0
+        self._line_len = 0
+
+        self._retry_handler = _RetryLogHandler(self)
+        self._openai_log = logging.getLogger(OPENAI_LOGGER)
+        self._openai_log_level = self._openai_log.level
+        if not self._openai_log.isEnabledFor(logging.INFO):
+            self._openai_log.setLevel(logging.INFO)
+        self._openai_log.addHandler(self._retry_handler)
+
+        self._refresh(force=True)
+
+        # heartbeat keeps elapsed/ETA/updated_at current while a request is slow or hanging
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._beat, name="progress-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    # ---------- recording ----------
+    def call(self, fn, *args, **kwargs):
+        """Run one LLM request through the monitor; retries are left to the openai SDK."""
+        with self._lock:
+            self.in_flight += 1
+        self._refresh(force=True)
+        failed = False
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            # runs on every exit path (incl. KeyboardInterrupt) so in_flight never stays raised
+            self._finish_request()
+            if failed:
+                self._record_error()
+
+    def advance(self, n=1):
+        with self._lock:
+            self.done += n
+        self._refresh(force=True)
+
+    def log(self, message):
+        """Print a message without garbling the live progress line."""
+        with self._lock:
+            self._clear_line()
+            print(message, flush=True)
+        self._refresh(force=True)
+
+    def close(self, state="finished"):
+        self._stop.set()
+        self._heartbeat.join()
+        self._openai_log.removeHandler(self._retry_handler)
+        self._openai_log.setLevel(self._openai_log_level)
+        with self._lock:
+            self.state = state
+        self._refresh(force=True)
+        if self._tty:
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close("failed" if exc_type else "finished")
+        return False
+
+    def _finish_request(self):
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self._request_times.append(time.time())
+        self._refresh(force=True)
+
+    def _record_error(self):
+        with self._lock:
+            self.errors += 1
+            self._error_times.append(time.time())
+        self._refresh(force=True)
+
+    def _record_retry(self):
+        # a retry means one HTTP attempt already came back (or timed out) without a result
+        now = time.time()
+        with self._lock:
+            self.retries += 1
+            self.requests += 1
+            self._retry_times.append(now)
+            self._request_times.append(now)
+        self._refresh(force=True)
+
+    # ---------- reporting ----------
+    def snapshot(self):
+        """Current status as a JSON-serialisable dict."""
+        with self._lock:
+            now = time.time()
+            for times in (self._request_times, self._error_times, self._retry_times):
+                while times and times[0] < now - WINDOW_SEC:
+                    times.popleft()
+
+            elapsed = now - self._start
+            window = max(min(WINDOW_SEC, elapsed), 1.0)
+            rate = len(self._request_times) / window * 60
+            unit_rate = self.done / elapsed if elapsed > 0 else 0.0
+            remaining = max(self.total - self.done, 0)
+            eta = remaining / unit_rate if unit_rate > 0 else None
+
+            return {
+                "label": self.label,
+                "state": self.state,
+                "pid": os.getpid(),
+                "done": self.done,
+                "total": self.total,
+                "percent": round(100.0 * self.done / self.total, 1) if self.total else 100.0,
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "requests_per_min": round(rate, 2),
+                "errors": self.errors,
+                "retries": self.retries,
+                "recent_errors": len(self._error_times),
+                "recent_retries": len(self._retry_times),
+                "window_sec": WINDOW_SEC,
+                "elapsed_sec": round(elapsed, 1),
+                "eta_sec": round(eta, 1) if eta is not None else None,
+                "updated_at": now,
+            }
+
+    def _beat(self):
+        while not self._stop.wait(REFRESH_SEC):
+            self._refresh()
+
+    def _refresh(self, force=False):
+        # State changes pass `force`, which always rewrites the status file but only redraws the
+        # live line on a tty; in log mode the heartbeat prints a line every LOG_EVERY_SEC and one
+        # more is printed when the run ends.
+        now = time.time()
+        with self._lock:
+            show = (force and (self._tty or self.state != "running")) or \
+                now - self._last_render >= (REFRESH_SEC if self._tty else LOG_EVERY_SEC)
+            write = self.status_file and (force or now - self._last_write >= REFRESH_SEC)
+            if show:
+                self._last_render = now
+            if write:
+                self._last_write = now
+        if not (show or write):
+            return
+
+        snap = self.snapshot()
+        if show:
+            line = (
+                f"[{snap['label']}] {snap['done']}/{snap['total']} ({snap['percent']:.1f}%) | "
+                f"{snap['requests_per_min']:.1f} req/min | in-flight {snap['in_flight']} | "
+                f"err {snap['recent_errors']} retry {snap['recent_retries']} (last {int(WINDOW_SEC)}s) | "
+                f"elapsed {_fmt_duration(snap['elapsed_sec'])} ETA {_fmt_duration(snap['eta_sec'])}"
+            )
+            with self._lock:
+                if self._tty:
+                    self._clear_line()
+                    sys.stderr.write(line)
+                    sys.stderr.flush()
+                    self._line_len = len(line)
+                else:
+                    print(line, file=sys.stderr, flush=True)
+        if write:
+            with self._io_lock:
+                self._write_status(snap)
+
+    def _clear_line(self):
+        if self._tty and self._line_len:
+            sys.stderr.write("\r" + " " * self._line_len + "\r")
+            self._line_len = 0
+
+    def _write_status(self, snap):
+        # write-then-rename so pollers never read a half-written file
+        tmp = f"{self.status_file}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(snap, f, indent=2)
+            os.replace(tmp, self.status_file)
+        except OSError as e:
+            print(f"[WARN] Could not write status file {self.status_file}: {e}", file=sys.stderr)
+            self.status_file = None